@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import string
 from types import MappingProxyType
 from typing import TYPE_CHECKING
@@ -24,9 +25,11 @@ from . import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Iterator, Mapping, Sequence
     from typing import Any, Final, Literal, Protocol
 
+    import numpy.typing as npt
+
     Encoding = Literal["utf-8", "cp1252"]
 
 
@@ -48,6 +51,15 @@ R_MINIMUM_VERSIONS: Final[Mapping[int, int]] = MappingProxyType({
     3: 0x30500,
 })
 
+# Printable ASCII characters, also as a lookup table indexed by code point
+_PRINTABLE_BYTES: Final = string.printable.encode("ascii")
+_PRINTABLE_LUT: Final = np.zeros(256, dtype=np.bool_)
+_PRINTABLE_LUT[np.frombuffer(_PRINTABLE_BYTES, dtype=np.uint8)] = True
+
+# Maximum ratio between the size of a string array and the length
+# of its strings for checking all the characters at once
+_MAX_PADDING_FACTOR: Final = 4
+
 
 def build_r_object(
         r_type: RObjectType,
@@ -74,21 +86,118 @@ def build_r_object(
         RObject
         RObjectInfo
     """
-    assert r_type is not None
+    # Positional arguments, as this is called for every converted object
     return RObject(
         RObjectInfo(
             r_type,
-            object=False,
-            attributes=attributes is not None,
-            tag=tag is not None,
-            gp=gp,
-            reference=0,
-         ),
-         value,
-         attributes,
-         tag,
-         None,
-     )
+            False,  # noqa: FBT003
+            attributes is not None,
+            tag is not None,
+            gp,
+            0,
+        ),
+        value,
+        attributes,
+        tag,
+        None,
+    )
+
+
+def _get_non_ascii_char_flag(encoding: Encoding) -> CharFlags:
+    """
+    Get the flag of a non-ASCII R string of given encoding.
+
+    Args:
+        encoding: Encoding of the string.
+
+    Returns:
+        Flag for the R object.
+    """
+    if encoding == "utf-8":
+        return CharFlags.UTF8
+    if encoding == "cp1252":
+        # Note!
+        # CP1252 and Latin1 are not the same.
+        # Does CharFlags.LATIN1 mean actually CP1252
+        # as R on Windows mentions CP1252 as encoding?
+        # Or does CP1252 change to e.g. CP1250 depending on localization?
+        return CharFlags.LATIN1
+    msg = f"unsupported encoding: {encoding}"
+    raise ValueError(msg)
+
+
+def _is_printable(data: bytes) -> bool:
+    """Check if all the characters in the string are printable ASCII."""
+    # Deleting the printable characters leaves nothing
+    return not data.translate(None, _PRINTABLE_BYTES)
+
+
+def build_r_char(
+        data: bytes | None,
+        *,
+        encoding: Encoding,
+) -> RObject:
+    """
+    Build R object representing a string.
+
+    Args:
+        data: Encoded string or None (NA).
+        encoding: Encoding of the string.
+
+    Returns:
+        R object.
+    """
+    if data is None:
+        return build_r_object(RObjectType.CHAR)
+
+    gp = (CharFlags.ASCII if _is_printable(data)
+          else _get_non_ascii_char_flag(encoding))
+    return build_r_object(RObjectType.CHAR, value=data, gp=gp)
+
+
+def _encode_str_array(
+        data: npt.NDArray[np.str_],
+        encoding: Encoding,
+) -> tuple[list[bytes], list[CharFlags]]:
+    """
+    Encode an array of strings.
+
+    Args:
+        data: 1D array of strings.
+        encoding: Encoding to be used for the strings.
+
+    Returns:
+        Encoded strings and the corresponding flags for R objects.
+    """
+    data = np.ascontiguousarray(data, dtype=data.dtype.newbyteorder("="))
+    # Encoding Python strings is faster than np.char.encode,
+    # which goes through numpy scalars and a bytes array
+    encoded = [value.encode(encoding) for value in data.tolist()]
+
+    width = data.dtype.itemsize // np.dtype(np.uint32).itemsize
+    total_length = sum(map(len, encoded))
+    if len(data) * width > _MAX_PADDING_FACTOR * total_length:
+        # Mostly padding (e.g. one long string among short ones):
+        # checking the encoded strings one by one is cheaper
+        is_printable = np.array(
+            [_is_printable(value) for value in encoded], dtype=np.bool_)
+    else:
+        # Check all the characters at once by looking at the code points
+        # (the array is padded with zeros after the end of each string)
+        codes = data.view(np.uint32).reshape(len(data), width)
+        padding = np.arange(width) >= np.char.str_len(data)[:, np.newaxis]
+        is_printable_char = _PRINTABLE_LUT[np.minimum(codes, 255)] | padding
+        is_printable = np.all(is_printable_char, axis=1)
+
+    if is_printable.all():
+        return encoded, [CharFlags.ASCII] * len(encoded)
+
+    non_ascii_gp = _get_non_ascii_char_flag(encoding)
+    gps = [
+        CharFlags.ASCII if printable else non_ascii_gp
+        for printable in is_printable.tolist()
+    ]
+    return encoded, gps
 
 
 def build_r_list(
@@ -116,27 +225,26 @@ def build_r_list(
         msg = "data must not be empty"
         raise ValueError(msg)
 
-    if isinstance(data, dict):
-        data = data.copy()
-        key = next(iter(data))
-        value1 = convert_value(data.pop(key), encoding=encoding)
-        tag = build_r_sym(key, encoding=encoding)
-    elif isinstance(data, list):
-        value1 = convert_value(data[0], encoding=encoding)
-        data = data[1:]
-        tag = None
-
-    if len(data) == 0:
-        value2 = build_r_object(RObjectType.NILVALUE)
-    else:
-        value2 = build_r_list(data, encoding=encoding, convert_value=convert_value)
+    items = (
+        [(build_r_sym(key, encoding=encoding),
+          convert_value(value, encoding=encoding))
+         for key, value in data.items()]
+        if isinstance(data, dict)
+        else [(None, convert_value(value, encoding=encoding))
+              for value in data]
+    )
 
-    return build_r_object(
-        RObjectType.LIST,
-        value=(value1, value2),
-        tag=tag,
+    # Build the linked list from tail to head
+    r_list = build_r_object(RObjectType.NILVALUE)
+    for tag, r_value in reversed(items):
+        r_list = build_r_object(
+            RObjectType.LIST,
+            value=(r_value, r_list),
+            tag=tag,
         )
 
+    return r_list
+
 
 def build_r_sym(
         data: str,
@@ -154,7 +262,7 @@ def build_r_sym(
         R object.
     """
     r_type = RObjectType.SYM
-    r_value = convert_to_r_object(data.encode(encoding), encoding=encoding)
+    r_value = build_r_char(data.encode(encoding), encoding=encoding)
     return build_r_object(r_type, value=r_value)
 
 
@@ -218,7 +326,272 @@ def convert_to_r_object_for_rda(
     return build_r_list(data, encoding=encoding)
 
 
-def convert_to_r_object(  # noqa: C901, PLR0912, PLR0915
+def _convert_none(
+        data: None,  # noqa: ARG001
+        *,
+        encoding: Encoding,  # noqa: ARG001
+) -> RObject:
+    """Convert None to R object."""
+    return build_r_object(RObjectType.NILVALUE)
+
+
+def _convert_expression(
+        data: RExpression,
+        *,
+        encoding: Encoding,
+) -> RObject:
+    """Convert RExpression to R object."""
+    r_value = [convert_to_r_object(el, encoding=encoding) for el in data.elements]
+    return build_r_object(RObjectType.EXPR, value=r_value)
+
+
+def _convert_language(
+        data: RLanguage,
+        *,
+        encoding: Encoding,
+) -> RObject:
+    """Convert RLanguage to R object."""
+    r_type = RObjectType.LANG
+    values = data.elements
+    r_value = (build_r_sym(str(values[0]), encoding=encoding),
+               build_r_list(values[1:], encoding=encoding,
+                            convert_value=build_r_sym))
+
+    if len(data.attributes) > 0:
+        # The following might work here (untested)
+        # attributes = build_r_list(data.attributes, encoding=encoding)  # noqa: ERA001,E501
+        msg = f"type {r_type} with attributes not implemented"
+        raise NotImplementedError(msg)
+
+    return build_r_object(r_type, value=r_value)
+
+
+def _build_r_vec(
+        data: list[Any] | tuple[Any, ...] | dict[str, Any],
+        r_value: list[RObject],
+        *,
+        encoding: Encoding,
+) -> RObject:
+    """Build R object of list, tuple, or dictionary from converted values."""
+    attributes = None
+    if isinstance(data, dict):
+        names = np.array(list(data.keys()), dtype=np.dtype("U"))
+        attributes = build_r_list({"names": names},
+                                  encoding=encoding)
+
+    return build_r_object(RObjectType.VEC, value=r_value, attributes=attributes)
+
+
+def _convert_sequence(
+        data: list[Any] | tuple[Any, ...] | dict[str, Any],
+        *,
+        encoding: Encoding,
+) -> RObject:
+    """
+    Convert list, tuple, or dictionary to R object.
+
+    Nested lists, tuples, and dictionaries are converted using a stack
+    instead of recursion. This only applies to the conversion: unparsing,
+    comparing, or printing the resulting R object still recurses once
+    per nesting level.
+    """
+    def iter_values(sequence: Any) -> Iterator[Any]:  # noqa: ANN401
+        return iter(sequence.values() if isinstance(sequence, dict) else sequence)
+
+    # Sequences being converted, with iterators over their remaining values
+    # and their already converted values
+    stack: list[tuple[Any, Iterator[Any], list[RObject]]] = [
+        (data, iter_values(data), []),
+    ]
+    # Identities of the sequences in the stack, for detecting cycles
+    stack_ids = {id(data)}
+    while True:
+        sequence, values, r_value = stack[-1]
+        for value in values:
+            if type(value) in _SEQUENCE_TYPES:
+                if id(value) in stack_ids:
+                    msg = "self-referential sequence cannot be converted"
+                    raise ValueError(msg)
+                # Convert the nested sequence first
+                stack.append((value, iter_values(value), []))
+                stack_ids.add(id(value))
+                break
+            r_value.append(convert_to_r_object(value, encoding=encoding))
+        else:
+            stack.pop()
+            stack_ids.remove(id(sequence))
+            r_object = _build_r_vec(sequence, r_value, encoding=encoding)
+            if not stack:
+                return r_object
+            stack[-1][2].append(r_object)
+
+
+def _convert_object_array(
+        data: npt.NDArray[np.object_],
+        *,
+        encoding: Encoding,
+) -> RObject:
+    """Convert object array to R object."""
+    # This is a special case handling only np.array([None])
+    if data.size != 1 or data[0] is not None:
+        msg = "general object array not implemented"
+        raise NotImplementedError(msg)
+    r_value = [build_r_char(None, encoding=encoding)]
+    return build_r_object(RObjectType.STR, value=r_value)
+
+
+def _convert_bytes_array(
+        data: npt.NDArray[np.bytes_],
+        *,
+        encoding: Encoding,
+) -> RObject:
+    """Convert bytestring array to R object."""
+    assert data.ndim == 1
+    r_value = [build_r_char(el, encoding=encoding) for el in data.tolist()]
+    return build_r_object(RObjectType.STR, value=r_value)
+
+
+def _convert_str_array(
+        data: npt.NDArray[np.str_],
+        *,
+        encoding: Encoding,
+) -> RObject:
+    """Convert string array to R object."""
+    assert data.ndim == 1
+    encoded, gps = _encode_str_array(data, encoding)
+    r_value = [
+        build_r_object(RObjectType.CHAR, value=value, gp=gp)
+        for value, gp in zip(encoded, gps)
+    ]
+    return build_r_object(RObjectType.STR, value=r_value)
+
+
+def _convert_numeric_array(
+        data: npt.NDArray[Any],
+        *,
+        encoding: Encoding,
+) -> RObject:
+    """Convert boolean or numeric array to R object."""
+    r_type = _NUMERIC_KIND_TO_R_TYPE[data.dtype.kind]
+
+    attributes = None
+    if data.ndim == 0:
+        r_value = data[np.newaxis]
+    elif data.ndim == 1:
+        r_value = data
+    else:
+        # R uses column-major order like Fortran
+        # (this is a view without copying for Fortran-ordered arrays)
+        r_value = np.ravel(data, order="F")
+        dim = np.array(data.shape, dtype=np.int32)
+        attributes = build_r_list({"dim": dim}, encoding=encoding)
+
+    return build_r_object(r_type, value=r_value, attributes=attributes)
+
+
+def _convert_array(
+        data: npt.NDArray[Any],
+        *,
+        encoding: Encoding,
+) -> RObject:
+    """Convert numpy array to R object."""
+    converter = _ARRAY_CONVERTERS.get(data.dtype.kind)
+    if converter is None:
+        msg = f"array of dtype {data.dtype} not implemented"
+        raise NotImplementedError(msg)
+    return converter(data, encoding=encoding)
+
+
+def _convert_scalar(
+        data: complex,
+        *,
+        encoding: Encoding,  # noqa: ARG001
+) -> RObject:
+    """Convert boolean or numeric scalar to R object."""
+    r_value = np.array([data])
+    r_type = _NUMERIC_KIND_TO_R_TYPE.get(r_value.dtype.kind)
+    if r_type is None:
+        # Integers not fitting in int64 produce object arrays
+        msg = f"scalar {data!r} not implemented"
+        raise NotImplementedError(msg)
+    return build_r_object(r_type, value=r_value)
+
+
+def _convert_str(
+        data: str,
+        *,
+        encoding: Encoding,
+) -> RObject:
+    """Convert string to R object."""
+    r_value = [build_r_char(data.encode(encoding), encoding=encoding)]
+    return build_r_object(RObjectType.STR, value=r_value)
+
+
+def _convert_bytes(
+        data: bytes,
+        *,
+        encoding: Encoding,
+) -> RObject:
+    """Convert bytestring to R object."""
+    return build_r_char(data, encoding=encoding)
+
+
+_SEQUENCE_TYPES: Final = frozenset({list, tuple, dict})
+
+_NUMERIC_KIND_TO_R_TYPE: Final[Mapping[str, RObjectType]] = MappingProxyType({
+    "b": RObjectType.LGL,
+    "i": RObjectType.INT,
+    "f": RObjectType.REAL,
+    "c": RObjectType.CPLX,
+})
+
+# Converters for numpy arrays by the kind of their dtype
+_ARRAY_CONVERTERS: Final[Mapping[str, Converter]] = MappingProxyType({
+    "O": _convert_object_array,
+    "S": _convert_bytes_array,
+    "U": _convert_str_array,
+    **dict.fromkeys(_NUMERIC_KIND_TO_R_TYPE, _convert_numeric_array),
+})
+
+# Converters for Python types, in the order in which they are checked
+_CONVERTERS: Final[Sequence[tuple[type | tuple[type, ...], Converter]]] = (
+    (type(None), _convert_none),
+    (RExpression, _convert_expression),
+    (RLanguage, _convert_language),
+    ((list, tuple, dict), _convert_sequence),
+    (np.ndarray, _convert_array),
+    ((bool, int, float, complex), _convert_scalar),
+    (str, _convert_str),
+    (bytes, _convert_bytes),
+)
+
+# Converters for exact Python types, for dispatching with a single lookup
+# (subclasses of the supported types are added when first converted)
+_CONVERTERS_BY_TYPE: Final[Mapping[type, Converter]] = MappingProxyType({
+    data_type: converter
+    for data_types, converter in _CONVERTERS
+    for data_type in (
+        data_types if isinstance(data_types, tuple) else (data_types,)
+    )
+})
+
+
+@functools.lru_cache(maxsize=128)
+def _find_converter(data_type: type) -> Converter:
+    """
+    Find the converter for a subclass of the supported types.
+
+    The most recently used subclasses are remembered in a bounded cache.
+    """
+    for data_types, converter in _CONVERTERS:
+        if issubclass(data_type, data_types):
+            return converter
+
+    msg = f"type {data_type} not implemented"
+    raise NotImplementedError(msg)
+
+
+def convert_to_r_object(
         data: Any,  # noqa: ANN401
         *,
         encoding: Encoding = "utf-8",
@@ -236,108 +609,8 @@ def convert_to_r_object(  # noqa: C901, PLR0912, PLR0915
     See Also:
         convert_to_r_data
     """
-    # Default args for most types (None/False/0)
-    r_type = None
-    values: list[Any] | tuple[Any, ...]
-    r_value: Any = None
-    gp = 0
-    attributes = None
-    tag = None
-
-    if data is None:
-        r_type = RObjectType.NILVALUE
-
-    elif isinstance(data, RExpression):
-        r_type = RObjectType.EXPR
-        r_value = [convert_to_r_object(el, encoding=encoding) for el in data.elements]
-
-    elif isinstance(data, RLanguage):
-        r_type = RObjectType.LANG
-        values = data.elements
-        r_value = (build_r_sym(str(values[0]), encoding=encoding),
-                   build_r_list(values[1:], encoding=encoding,
-                                convert_value=build_r_sym))
-
-        if len(data.attributes) > 0:
-            # The following might work here (untested)
-            # attributes = build_r_list(data.attributes, encoding=encoding)  # noqa: ERA001,E501
-            msg = f"type {r_type} with attributes not implemented"
-            raise NotImplementedError(msg)
-
-    elif isinstance(data, (list, tuple, dict)):
-        r_type = RObjectType.VEC
-        values = list(data.values()) if isinstance(data, dict) else data
-        r_value = [convert_to_r_object(el, encoding=encoding) for el in values]
-
-        if isinstance(data, dict):
-            names = np.array(list(data.keys()), dtype=np.dtype("U"))
-            attributes = build_r_list({"names": names},
-                                      encoding=encoding)
-
-    elif isinstance(data, np.ndarray):
-        if data.dtype.kind in ["O"]:
-            # This is a special case handling only np.array([None])
-            if data.size != 1 or data[0] is not None:
-                msg = "general object array not implemented"
-                raise NotImplementedError(msg)
-            r_type = RObjectType.STR
-            r_value = [build_r_object(RObjectType.CHAR)]
-
-        elif data.dtype.kind in ["S"]:
-            assert data.ndim == 1
-            r_type = RObjectType.STR
-            r_value = [convert_to_r_object(el, encoding=encoding) for el in data]
-
-        elif data.dtype.kind in ["U"]:
-            assert data.ndim == 1
-            data = np.array([s.encode(encoding) for s in data], dtype=np.dtype("S"))
-            return convert_to_r_object(data, encoding=encoding)
-
-        else:
-            r_type = {
-                "b": RObjectType.LGL,
-                "i": RObjectType.INT,
-                "f": RObjectType.REAL,
-                "c": RObjectType.CPLX,
-            }[data.dtype.kind]
-
-            if data.ndim == 0:
-                r_value = data[np.newaxis]
-            elif data.ndim == 1:
-                r_value = data
-            else:
-                # R uses column-major order like Fortran
-                r_value = np.ravel(data, order="F")
-                attributes = build_r_list({"dim": np.array(data.shape)},
-                                          encoding=encoding)
-
-    elif isinstance(data, (bool, int, float, complex)):
-        return convert_to_r_object(np.array(data), encoding=encoding)
-
-    elif isinstance(data, str):
-        r_type = RObjectType.STR
-        r_value = [convert_to_r_object(data.encode(encoding), encoding=encoding)]
-
-    elif isinstance(data, bytes):
-        r_type = RObjectType.CHAR
-        if all(chr(byte) in string.printable for byte in data):
-            gp = CharFlags.ASCII
-        elif encoding == "utf-8":
-            gp = CharFlags.UTF8
-        elif encoding == "cp1252":
-            # Note!
-            # CP1252 and Latin1 are not the same.
-            # Does CharFlags.LATIN1 mean actually CP1252
-            # as R on Windows mentions CP1252 as encoding?
-            # Or does CP1252 change to e.g. CP1250 depending on localization?
-            gp = CharFlags.LATIN1
-        else:
-            msg = f"unsupported encoding: {encoding}"
-            raise ValueError(msg)
-        r_value = data
-
-    else:
-        msg = f"type {type(data)} not implemented"
-        raise NotImplementedError(msg)
+    converter = _CONVERTERS_BY_TYPE.get(type(data))
+    if converter is None:
+        converter = _find_converter(type(data))  # type: ignore [arg-type]
 
-    return build_r_object(r_type, value=r_value, attributes=attributes, tag=tag, gp=gp)
+    return converter(data, encoding=encoding)
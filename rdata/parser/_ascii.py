@@ -23,11 +23,29 @@ class ParserASCII(Parser):
             expand_altrep=expand_altrep,
             altrep_constructor_dict=altrep_constructor_dict,
         )
-        self.file = io.TextIOWrapper(io.BytesIO(data), encoding="ascii")
+        # Read all the lines at once instead of one line per value
+        text = io.TextIOWrapper(io.BytesIO(data), encoding="ascii").read()
+        # Text after the last newline is not a complete line
+        *self.lines, self.incomplete_line = text.split("\n")
+        self.position = 0
 
     def _readline(self) -> str:
         r"""Read a line without trailing \n."""
-        return self.file.readline()[:-1]
+        if self.position >= len(self.lines):
+            msg = "Unexpected end of data"
+            raise ValueError(msg)
+        line = self.lines[self.position]
+        self.position += 1
+        return line
+
+    def _readlines(self, n: int) -> list[str]:
+        r"""Read n lines without trailing \n."""
+        lines = self.lines[self.position:self.position + n]
+        if len(lines) != n:
+            msg = "Unexpected end of data"
+            raise ValueError(msg)
+        self.position += n
+        return lines
 
     def _parse_array_values(
             self,
@@ -35,29 +53,23 @@ class ParserASCII(Parser):
             length: int,
     ) -> npt.NDArray[Any]:
 
-        array = np.empty(length, dtype=dtype)
-        value: int | float | complex
+        if np.issubdtype(dtype, np.integer):
+            return np.array(
+                [R_INT_NA if line == "NA" else int(line)
+                 for line in self._readlines(length)],
+                dtype=dtype,
+            )
 
-        for i in range(length):
-            line = self._readline()
+        if np.issubdtype(dtype, np.floating):
+            return np.array(self._readlines(length), dtype=dtype)
 
-            if np.issubdtype(dtype, np.integer):
-                value = R_INT_NA if line == "NA" else int(line)
+        if np.issubdtype(dtype, np.complexfloating):
+            # Real and imaginary parts are in consecutive lines
+            parts = np.array(self._readlines(2 * length), dtype=np.float64)
+            return parts.view(np.complex128).astype(dtype, copy=False)
 
-            elif np.issubdtype(dtype, np.floating):
-                value = float(line)
-
-            elif np.issubdtype(dtype, np.complexfloating):
-                line2 = self._readline()
-                value = complex(float(line), float(line2))
-
-            else:
-                msg = f"Unknown dtype: {dtype}"
-                raise ValueError(msg)
-
-            array[i] = value
-
-        return array
+        msg = f"Unknown dtype: {dtype}"
+        raise ValueError(msg)
 
     def parse_string(self, length: int) -> bytes:
         # Read the ascii string
@@ -100,4 +112,5 @@ class ParserASCII(Parser):
         return b
 
     def check_complete(self) -> None:
-        assert self.file.read(1) == ""
+        assert self.position == len(self.lines)
+        assert not self.incomplete_line
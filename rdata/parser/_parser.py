@@ -608,10 +608,12 @@ class Parser(abc.ABC):
     ) -> npt.NDArray[np.int32] | np.ma.MaskedArray[Any, Any]:
         """Parse an integer array."""
         data = self._parse_array(np.int32)
-        mask = (data == R_INT_NA)
-        data[mask] = fill_value
 
-        if np.any(mask):
+        # R_INT_NA is the minimum int32, so a single reduction tells
+        # whether the mask is needed
+        if data.size > 0 and data.min() == R_INT_NA:
+            mask = (data == R_INT_NA)
+            data[mask] = fill_value
             return np.ma.array(  # type: ignore [no-untyped-call,no-any-return]
                 data=data,
                 mask=mask,
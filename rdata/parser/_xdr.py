@@ -1,13 +1,24 @@
 from __future__ import annotations
 
+import functools
 import io
-from typing import Any
+from typing import Any, Final
 
 import numpy as np
 import numpy.typing as npt
 
 from ._parser import AltRepConstructorMap, Parser
 
+# Size in bytes of an integer in XDR format
+_INT_SIZE: Final = 4
+
+
+@functools.lru_cache
+def _get_dtypes(dtype: npt.DTypeLike) -> tuple[np.dtype[Any], np.dtype[Any]]:
+    """Get the native and big-endian dtypes."""
+    dtype = np.dtype(dtype)
+    return dtype, dtype.newbyteorder(">")
+
 
 class ParserXDR(Parser):
     """Parser for data in XDR format."""
@@ -25,17 +36,25 @@ class ParserXDR(Parser):
         )
         self.file = io.BytesIO(data)
 
+    def parse_int(self) -> int:
+        # Faster than parsing a one-element array
+        data = self.file.read(_INT_SIZE)
+        if len(data) != _INT_SIZE:
+            msg = "Unexpected end of data"
+            raise ValueError(msg)
+        return int.from_bytes(data, "big", signed=True)
+
     def _parse_array_values(
             self,
             dtype: npt.DTypeLike,
             length: int,
     ) -> npt.NDArray[Any]:
-        dtype = np.dtype(dtype)
+        dtype, big_endian_dtype = _get_dtypes(dtype)  # type: ignore [arg-type]
         buffer = self.file.read(length * dtype.itemsize)
         # Read in big-endian order and convert to native byte order
         return np.frombuffer(
             buffer,
-            dtype=dtype.newbyteorder(">"),
+            dtype=big_endian_dtype,
         ).astype(dtype, copy=False)
 
     def parse_string(self, length: int) -> bytes:
@@ -783,6 +783,28 @@ class SimpleTests(unittest.TestCase):
         data = rdata.read_rds(TESTDATA_PATH / "test_ascii_nan_inf.rds")
         np.testing.assert_equal(data, [0., np.nan, np.inf, -np.inf])
 
+    def test_truncated_xdr(self) -> None:
+        """Test that parsing truncated XDR data raises an error."""
+        parsed = rdata.parser.parse_file(TESTDATA_PATH / "test_vector.rda")
+        data = rdata.unparser.unparse_data(parsed, file_type="rda")
+        for n_bytes in (1, 2, 3):
+            with pytest.raises(ValueError, match="Unexpected end of data"):
+                rdata.parser.parse_data(data[:-n_bytes])
+
+    def test_truncated_ascii(self) -> None:
+        """Test that parsing truncated ASCII data raises an error."""
+        parsed = rdata.parser.parse_file(TESTDATA_PATH / "test_vector.rda")
+        data = rdata.unparser.unparse_data(
+            parsed, file_format="ascii", file_type="rda")
+        for n_bytes in (1, 2, 3, 5):
+            with pytest.raises(ValueError, match="Unexpected end of data"):
+                rdata.parser.parse_data(data[:-n_bytes])
+
+        # Extra empty lines are not accepted either
+        for extra in (b"\n", b"\n\n"):
+            with pytest.raises(AssertionError):
+                rdata.parser.parse_data(data + extra)
+
 
 
 if __name__ == "__main__":
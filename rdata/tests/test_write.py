@@ -2,17 +2,33 @@
 
 from __future__ import annotations
 
+import bz2
+import gzip
+import io
+import lzma
+import sys
 import tempfile
 from contextlib import AbstractContextManager, nullcontext
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, Literal, NamedTuple
 
+import numpy as np
 import pytest
 
 import rdata
-from rdata.unparser import unparse_data
+from rdata.parser._parser import (
+    FileTypes,
+    RdataFormats,
+    file_type,
+    magic_dict,
+    rdata_format,
+)
+from rdata.unparser import unparse_data, unparse_fileobj
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from rdata.conversion.to_r import Encoding
     from rdata.unparser import Compression, FileFormat, FileType
 
@@ -23,35 +39,28 @@ valid_compressions = [None, "bzip2", "gzip", "xz"]
 valid_formats = ["xdr", "ascii"]
 
 
-def decompress_data(data: bytes) -> bytes:
-    """Decompress bytes."""
-    from rdata.parser._parser import FileTypes, file_type
+DECOMPRESSORS: dict[FileTypes | None, Callable[[bytes], bytes]] = {
+    FileTypes.bzip2: bz2.decompress,
+    FileTypes.gzip: gzip.decompress,
+    FileTypes.xz: lzma.decompress,
+}
 
-    filetype = file_type(memoryview(data))
 
-    if filetype is FileTypes.bzip2:
-        from bz2 import decompress
-    elif filetype is FileTypes.gzip:
-        from gzip import decompress
-    elif filetype is FileTypes.xz:
-        from lzma import decompress
-    else:
-        return data
+def decompress_data(data: bytes) -> bytes:
+    """Decompress bytes."""
+    decompress = DECOMPRESSORS.get(file_type(memoryview(data)))
+    return data if decompress is None else decompress(data)
 
-    return decompress(data)
 
+raw_data = {
+    fpath.name: fpath.read_bytes()
+    for fpath in Path(str(TESTDATA_PATH)).glob("*.rd?")
+}
+fnames = sorted(raw_data)
 
-fnames = sorted([fpath.name for fpath in Path(str(TESTDATA_PATH)).glob("*.rd?")])
 
 def parse_file_type_and_format(data: bytes) -> tuple[FileType, FileFormat]:
     """Parse file type and format from data."""
-    from rdata.parser._parser import (
-        FileTypes,
-        RdataFormats,
-        file_type,
-        magic_dict,
-        rdata_format,
-    )
     view = memoryview(data)
 
     file_type_str: FileType
@@ -76,74 +85,137 @@ def parse_file_type_and_format(data: bytes) -> tuple[FileType, FileFormat]:
     return file_type_str, file_format_str
 
 
-@pytest.mark.parametrize("fname", fnames, ids=fnames)
-def test_unparse(fname: str) -> None:
-    """Test unparsing RData object to a file."""
-    with (TESTDATA_PATH / fname).open("rb") as f:
-        data = decompress_data(f.read())
-        file_type, file_format = parse_file_type_and_format(data)
-        r_data = rdata.parser.parse_data(data, expand_altrep=False)
+class LoadedFile(NamedTuple):
+    """Test file with its detected type and format, and its parsed data."""
+
+    name: str
+    data: bytes
+    file_type: FileType
+    file_format: FileFormat
+    r_data: rdata.parser.RData
 
-        try:
-            out_data = unparse_data(
-                r_data, file_format=file_format, file_type=file_type)
-        except NotImplementedError as e:
-            pytest.xfail(str(e))
 
-        if file_format == "ascii":
-            data = data.replace(b"\r\n", b"\n")
+def load_data(fname: str) -> LoadedFile:
+    """Load, decompress, and parse a test file."""
+    data = decompress_data(raw_data[fname])
+    r_data = rdata.parser.parse_data(data, expand_altrep=False)
+    return LoadedFile(
+        fname, data, *parse_file_type_and_format(data), r_data)
+
+
+def first_difference(
+    a: bytes | bytearray | memoryview,
+    b: bytes | bytearray | memoryview,
+) -> int:
+    """Find the index of the first differing byte."""
+    return next(
+        (i for i, (x, y) in enumerate(zip(a, b)) if x != y),
+        min(len(a), len(b)),
+    )
 
-        assert data == out_data
 
+class CompareSink:
+    """Writable file object comparing the written data to the expected data."""
 
-@pytest.mark.parametrize("fname", fnames, ids=fnames)
-def test_convert_to_r(fname: str) -> None:
+    def __init__(self, expected: bytes) -> None:
+        """Writable file object comparing to the expected data."""
+        self.expected = memoryview(expected)
+        self.position = 0
+        self.mismatch: int | None = None
+
+    def write(self, data: bytes | bytearray | memoryview) -> int:
+        """Compare data to the expected data at the current position."""
+        end = self.position + len(data)
+        expected = self.expected[self.position:end]
+        if self.mismatch is None and expected != data:
+            self.mismatch = self.position + first_difference(expected, data)
+        self.position = end
+        return len(data)
+
+
+@pytest.fixture(scope="session", params=fnames, ids=fnames)
+def rfile(request: pytest.FixtureRequest) -> LoadedFile:
+    """Load each test file once per session."""
+    return load_data(request.param)
+
+
+def test_unparse(rfile: LoadedFile) -> None:
+    """Test unparsing RData object to a file."""
+    data = rfile.data
+    file_format = rfile.file_format
+
+    if file_format == "ascii":
+        # Escaped strings never contain a raw "\r", only line endings do
+        data = data.translate(None, b"\r")
+
+    sink = CompareSink(data)
+    try:
+        unparse_fileobj(
+            sink,  # type: ignore [arg-type]
+            rfile.r_data,
+            file_format=file_format,
+            file_type=rfile.file_type,
+        )
+    except NotImplementedError as e:
+        pytest.xfail(str(e))
+
+    assert sink.mismatch is None, f"output differs at byte {sink.mismatch}"
+    assert sink.position == len(data), (
+        f"output has {sink.position} bytes instead of {len(data)}")
+
+
+def test_unparse_data() -> None:
+    """Test unparsing RData object to a bytestring."""
+    rfile = load_data("test_vector.rda")
+    out_data = unparse_data(
+        rfile.r_data, file_format=rfile.file_format, file_type=rfile.file_type)
+    assert out_data == rfile.data
+
+
+def test_convert_to_r(rfile: LoadedFile) -> None:
     """Test converting Python data to RData object."""
-    with (TESTDATA_PATH / fname).open("rb") as f:
-        # Skip test files without unique R->py->R transformation
-        if fname in [
-            "test_encodings.rda",     # encoding not kept in Python
-            "test_encodings_v3.rda",  # encoding not kept in Python
-            "test_list_attrs.rda",    # attributes not kept in Python
-            "test_file.rda",          # attributes not kept in Python
-        ]:
-            pytest.skip("ambiguous R->py->R transformation")
-
-        data = decompress_data(f.read())
-        file_type, file_format = parse_file_type_and_format(data)
-
-        r_data = rdata.parser.parse_data(data, expand_altrep=False)
-
-        try:
-            py_data = rdata.conversion.convert(r_data)
-        except NotImplementedError as e:
-            pytest.skip(str(e))
-
-        encoding: Encoding
-        encoding = r_data.extra.encoding  # type: ignore [assignment]
-        if encoding is None:
-            encoding = "cp1252" if "win" in fname else "utf-8"
+    fname = rfile.name
+    r_data = rfile.r_data
+
+    # Skip test files without unique R->py->R transformation
+    if fname in [
+        "test_encodings.rda",     # encoding not kept in Python
+        "test_encodings_v3.rda",  # encoding not kept in Python
+        "test_list_attrs.rda",    # attributes not kept in Python
+        "test_file.rda",          # attributes not kept in Python
+    ]:
+        pytest.skip("ambiguous R->py->R transformation")
+
+    try:
+        py_data = rdata.conversion.convert(r_data)
+    except NotImplementedError as e:
+        pytest.skip(str(e))
+
+    encoding: Encoding
+    encoding = r_data.extra.encoding  # type: ignore [assignment]
+    if encoding is None:
+        encoding = "cp1252" if "win" in fname else "utf-8"
+    else:
+        encoding = encoding.lower()  # type: ignore [assignment]
+
+    try:
+        if rfile.file_type == "rds":
+            r_obj = rdata.conversion.convert_to_r_object(
+                py_data, encoding=encoding)
         else:
-            encoding = encoding.lower()  # type: ignore [assignment]
-
-        try:
-            if file_type == "rds":
-                r_obj = rdata.conversion.convert_to_r_object(
-                    py_data, encoding=encoding)
-            else:
-                r_obj = rdata.conversion.convert_to_r_object_for_rda(
-                    py_data, encoding=encoding)
-            new_r_data = rdata.conversion.build_r_data(
-                r_obj,
-                encoding=encoding,
-                format_version=r_data.versions.format,
-                r_version_serialized=r_data.versions.serialized,
-            )
-        except NotImplementedError as e:
-            pytest.xfail(str(e))
-
-        assert r_data == new_r_data
-        assert str(r_data) == str(new_r_data)
+            r_obj = rdata.conversion.convert_to_r_object_for_rda(
+                py_data, encoding=encoding)
+        new_r_data = rdata.conversion.build_r_data(
+            r_obj,
+            encoding=encoding,
+            format_version=r_data.versions.format,
+            r_version_serialized=r_data.versions.serialized,
+        )
+    except NotImplementedError as e:
+        pytest.xfail(str(e))
+
+    assert r_data == new_r_data
+    assert str(r_data) == str(new_r_data)
 
 
 def test_convert_to_r_bad_rda() -> None:
@@ -160,6 +232,20 @@ def test_convert_to_r_empty_rda() -> None:
         rdata.conversion.convert_to_r_object_for_rda(py_data)
 
 
+def test_convert_to_r_long_rda() -> None:
+    """Test converting more variables than the recursion limit for RDA."""
+    length = sys.getrecursionlimit() + 100
+    py_data = {f"var{i}": i for i in range(length)}
+
+    r_obj = rdata.conversion.convert_to_r_object_for_rda(py_data)
+    for i in range(length):
+        assert r_obj.info.type is rdata.parser.RObjectType.LIST
+        assert r_obj.tag is not None
+        assert r_obj.tag.value.value == f"var{i}".encode("ascii")
+        r_obj = r_obj.value[1]
+    assert r_obj.info.type is rdata.parser.RObjectType.NILVALUE
+
+
 def test_unparse_bad_rda() -> None:
     """Test checking that data for RDA has variable names."""
     py_data = "hello"
@@ -181,6 +267,109 @@ def test_convert_to_r_unsupported_encoding() -> None:
         rdata.conversion.convert_to_r_object("ä", encoding="cp1250")  # type: ignore [arg-type]
 
 
+@pytest.mark.parametrize("strings", [
+    ["hello", "", "ä", "a\x01b", "ä"],
+    # Uneven lengths, checked string by string instead of all at once
+    ["x" * 2000, "", "ä", "a\x01b", "a"],
+])
+@pytest.mark.parametrize("encoding", ["utf-8", "cp1252"])
+def test_convert_to_r_str_array(encoding: Encoding, strings: list[str]) -> None:
+    """Test converting string array equal to converting each string."""
+    r_obj = rdata.conversion.convert_to_r_object(
+        np.array(strings), encoding=encoding)
+    assert r_obj.info.type is rdata.parser.RObjectType.STR
+    assert r_obj.value == [
+        rdata.conversion.convert_to_r_object(s, encoding=encoding).value[0]
+        for s in strings
+    ]
+
+
+@pytest.mark.parametrize("order", ["C", "F"])
+def test_convert_to_r_matrix(order: Literal["C", "F"]) -> None:
+    """Test converting matrices, without copying Fortran-ordered ones."""
+    data = np.array([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]], order=order)
+    r_obj = rdata.conversion.convert_to_r_object(data)
+    np.testing.assert_array_equal(r_obj.value, [1.0, 4.0, 2.0, 5.0, 3.0, 6.0])
+    assert np.shares_memory(r_obj.value, data) == (order == "F")
+
+
+def test_convert_to_r_deeply_nested() -> None:
+    """Test converting lists nested deeper than the recursion limit."""
+    # Only the conversion is iterative: unparsing this data would still
+    # exceed the recursion limit, so it is not written here
+    depth = sys.getrecursionlimit() + 100
+    py_data: list[Any] = []
+    inner = py_data
+    for _ in range(depth):
+        inner.append([])
+        inner = inner[0]
+
+    r_obj = rdata.conversion.convert_to_r_object(py_data)
+    for _ in range(depth):
+        assert r_obj.info.type is rdata.parser.RObjectType.VEC
+        assert len(r_obj.value) == 1
+        r_obj = r_obj.value[0]
+    assert r_obj.value == []
+
+
+def test_convert_to_r_independent_objects() -> None:
+    """Test that separate conversions do not share R objects."""
+    r_obj = rdata.conversion.convert_to_r_object("x")
+    r_obj.value[0].value = b"y"
+    assert rdata.conversion.convert_to_r_object("x").value[0].value == b"x"
+
+
+def test_convert_to_r_self_referential() -> None:
+    """Test that converting self-referential lists raises an error."""
+    py_data: list[Any] = [1]
+    py_data.append([py_data])
+    with pytest.raises(ValueError, match="self-referential"):
+        rdata.conversion.convert_to_r_object(py_data)
+
+    # Repeated but not nested sequences are valid
+    inner = [1.0]
+    r_obj = rdata.conversion.convert_to_r_object([inner, inner])
+    assert len(r_obj.value) == 2  # noqa: PLR2004
+
+
+@pytest.mark.parametrize("file_format", valid_formats)
+def test_unparser_flush(file_format: FileFormat) -> None:
+    """Test writing the buffered output of an unparser."""
+    r_obj = rdata.conversion.convert_to_r_object([1.5, "a"])
+    r_data = rdata.conversion.build_r_data(r_obj)
+
+    fd = io.BytesIO()
+    unparser = (
+        rdata.unparser.UnparserXDR(fd) if file_format == "xdr"
+        else rdata.unparser.UnparserASCII(fd)
+    )
+    unparser.unparse_r_object(r_obj)
+    assert fd.getvalue() == b""
+
+    unparser.flush()
+    out_data = fd.getvalue()
+    assert out_data
+    assert unparse_data(r_data, file_format=file_format).endswith(out_data)
+
+
+@pytest.mark.parametrize("file_format", valid_formats)
+def test_unparse_to_file_keeping_buffers(file_format: FileFormat) -> None:
+    """Test unparsing to a file object that keeps the written buffers."""
+    r_obj = rdata.conversion.convert_to_r_object(
+        np.array([f"string {i}" for i in range(20000)]))
+    r_data = rdata.conversion.build_r_data(r_obj)
+
+    chunks: list[bytes | bytearray | memoryview] = []
+    fileobj = SimpleNamespace(write=chunks.append)
+    unparse_fileobj(
+        fileobj,  # type: ignore [arg-type]
+        r_data,
+        file_format=file_format,
+    )
+    assert len(chunks) > 1
+    assert b"".join(chunks) == unparse_data(r_data, file_format=file_format)
+
+
 def test_unparse_big_int() -> None:
     """Test checking too large integers."""
     big_int = 2**32
@@ -190,6 +379,14 @@ def test_unparse_big_int() -> None:
         unparse_data(r_data, file_format="xdr")
 
 
+@pytest.mark.parametrize("value", [2**31, -2**31 - 1])
+def test_unparse_big_int_scalar(value: int) -> None:
+    """Test checking too large integer scalars, such as lengths."""
+    unparser = rdata.unparser.UnparserXDR(io.BytesIO())
+    with pytest.raises(ValueError, match=r"(?i)not castable"):
+        unparser.unparse_int(value)
+
+
 @pytest.mark.parametrize("compression", [*valid_compressions, "fail"])
 @pytest.mark.parametrize("file_format", [*valid_formats, None, "fail"])
 @pytest.mark.parametrize("file_type", ["rds", "rda"])
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import importlib
 import io
+import sys
+from types import MappingProxyType
 from typing import TYPE_CHECKING
 
 from rdata.parser import (
@@ -12,7 +15,7 @@ from rdata.parser import (
 
 if TYPE_CHECKING:
     import os
-    from typing import IO, Any, Literal
+    from typing import IO, Any, Final, Literal
 
     from rdata.parser import RData
 
@@ -58,6 +61,52 @@ def unparse_file(
         unparse_fileobj(f, r_data, file_format=file_format, file_type=file_type)
 
 
+# Unparser class name and rda magic of each file format
+_UNPARSER_NAMES: Final = MappingProxyType({
+    "ascii": ("UnparserASCII", "RDA"),
+    "xdr": ("UnparserXDR", "RDX"),
+})
+
+# Modules of the unparser classes, imported on first access
+_LAZY_IMPORTS: Final = MappingProxyType({
+    "UnparserASCII": "._ascii",
+    "UnparserXDR": "._xdr",
+})
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    """Import the unparser classes on first access and cache them."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def _get_unparser(
+        file_format: FileFormat,
+) -> tuple[type[UnparserXDR | UnparserASCII], str]:
+    """
+    Get the unparser class and rda magic for a file format.
+
+    Args:
+        file_format: File format.
+
+    Returns:
+        Unparser class and rda magic.
+    """
+    names = _UNPARSER_NAMES.get(file_format)
+    if names is None:
+        msg = f"Unknown file format: {file_format}"
+        raise ValueError(msg)
+
+    name, rda_magic = names
+    return getattr(sys.modules[__name__], name), rda_magic
+
+
 def unparse_fileobj(
         fileobj: IO[Any],
         r_data: RData,
@@ -74,17 +123,7 @@ def unparse_fileobj(
         file_format: File format.
         file_type: File type.
     """
-    Unparser: type[UnparserXDR | UnparserASCII]  # noqa: N806
-
-    if file_format == "ascii":
-        from ._ascii import UnparserASCII as Unparser
-        rda_magic = "RDA"
-    elif file_format == "xdr":
-        from ._xdr import UnparserXDR as Unparser
-        rda_magic = "RDX"
-    else:
-        msg = f"Unknown file format: {file_format}"
-        raise ValueError(msg)
+    Unparser, rda_magic = _get_unparser(file_format)  # noqa: N806
 
     # Check that RData object for rda file is of correct kind
     if file_type == "rda":
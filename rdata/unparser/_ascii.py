@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import string
+from types import MappingProxyType
 from typing import TYPE_CHECKING
 
 import numpy as np
@@ -10,7 +11,6 @@ import numpy as np
 from ._unparser import Unparser
 
 if TYPE_CHECKING:
-    import io
     from typing import Any, Final
 
     import numpy.typing as npt
@@ -45,27 +45,36 @@ def build_byte_to_str_map() -> tuple[str, ...]:
 
 BYTE_TO_STR: Final = build_byte_to_str_map()
 
+# Bytes that are written as they are
+UNESCAPED_BYTES: Final = bytes(
+    byte for byte, escaped in enumerate(BYTE_TO_STR) if escaped == chr(byte)
+)
+
+# Representations of special float values
+FLOAT_SPECIALS: Final = MappingProxyType({
+    "nan": "NaN",
+    "inf": "Inf",
+    "-inf": "-Inf",
+})
+
 
 class UnparserASCII(Unparser):
     """Unparser for files in ASCII format."""
 
-    def __init__(
-        self,
-        file: io.BytesIO,
-    ) -> None:
-        """Unparser for files in ASCII format."""
-        self.file = file
-
     def _add_line(self, line: str) -> None:
         r"""Write a line with trailing \n."""
         # Write in binary mode to be compatible with
         # compression (e.g. when file = gzip.open())
-        self.file.write(f"{line}\n".encode("ascii"))
+        self._write(f"{line}\n".encode("ascii"))
 
     def unparse_magic(self) -> None:
         """Unparse magic bits."""
         self._add_line("A")
 
+    def unparse_int(self, value: int | np.int32) -> None:
+        """Unparse an integer value."""
+        self._add_line(str(value))
+
     def _unparse_array_values(self, array: npt.NDArray[Any]) -> None:
         # Convert boolean to int
         if np.issubdtype(array.dtype, np.bool_):
@@ -76,28 +85,27 @@ class UnparserASCII(Unparser):
             assert array.dtype == np.complex128
             array = array.view(np.float64)
 
-        # Unparse data
-        for value in array:
-            if np.issubdtype(array.dtype, np.integer):
-                line = "NA" if value is None or np.ma.is_masked(value) else str(value)  # type: ignore [no-untyped-call]
-
-            elif np.issubdtype(array.dtype, np.floating):
-                if np.isnan(value):
-                    line = "NaN"
-                elif value == np.inf:
-                    line = "Inf"
-                elif value == -np.inf:
-                    line = "-Inf"
-                else:
-                    line = str(value)
-                    if line.endswith(".0"):
-                        line = line[:-2]
-
-            else:
-                msg = f"Unknown dtype: {array.dtype}"
-                raise ValueError(msg)
-
-            self._add_line(line)
+        # Format all values before writing them at once
+        if np.issubdtype(array.dtype, np.integer):
+            # Masked values are converted to None
+            lines = [
+                "NA" if value is None else str(value)
+                for value in array.tolist()
+            ]
+
+        elif np.issubdtype(array.dtype, np.floating):
+            # Python floats print like float64 scalars, but faster
+            values = array.tolist() if array.dtype == np.float64 else array
+            lines = []
+            for value in values:
+                line = str(value).removesuffix(".0")
+                lines.append(FLOAT_SPECIALS.get(line, line))
+
+        else:
+            msg = f"Unknown dtype: {array.dtype}"
+            raise ValueError(msg)
+
+        self._write("".join([f"{line}\n" for line in lines]).encode("ascii"))
 
     def _unparse_string_characters(self, value: bytes) -> None:
         # Ideally we could do here the reverse of parsing,
@@ -106,7 +114,11 @@ class UnparserASCII(Unparser):
         # but we need to have the equivalent octal presentation '\303\244'.
         # In addition, some ascii characters need to be escaped.
 
-        # Convert string byte-by-byte
-        output = "".join(BYTE_TO_STR[byte] for byte in value)
+        if not value.translate(None, UNESCAPED_BYTES):
+            # Nothing to escape
+            output = value.decode("ascii")
+        else:
+            # Convert string byte-by-byte
+            output = "".join(BYTE_TO_STR[byte] for byte in value)
 
         self._add_line(output)
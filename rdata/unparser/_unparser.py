@@ -17,9 +17,16 @@ from rdata.parser import (
 )
 
 if TYPE_CHECKING:
+    import io
+    from typing import Final
+
     import numpy.typing as npt
 
 
+# Size of the buffer used to collect small writes
+BUFFER_SIZE: Final = 1 << 16
+
+
 def pack_r_object_info(info: RObjectInfo) -> int:
     """Pack RObjectInfo to an integer."""
     if info.type == RObjectType.NILVALUE:
@@ -42,7 +49,40 @@ def pack_r_object_info(info: RObjectInfo) -> int:
 
 
 class Unparser(abc.ABC):
-    """Unparser interface for a R file."""
+    """
+    Unparser interface for a R file.
+
+    The output is buffered. :meth:`unparse_r_data` flushes it at the end,
+    but after calling the other unparse methods directly, :meth:`flush`
+    must be called to write the remaining output to the file.
+    """
+
+    def __init__(
+        self,
+        file: io.BytesIO,
+    ) -> None:
+        """Unparser interface for a R file."""
+        self.file = file
+        self._buffer = bytearray()
+
+    def _write(self, data: bytes | memoryview) -> None:
+        """Write data to the file through a buffer."""
+        if len(data) >= BUFFER_SIZE:
+            # Large data is written directly
+            self.flush()
+            self.file.write(data)
+            return
+
+        self._buffer += data
+        if len(self._buffer) >= BUFFER_SIZE:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write the buffered data to the file."""
+        if self._buffer:
+            # Start a new buffer, as the file may keep the written one
+            buffer, self._buffer = self._buffer, bytearray()
+            self.file.write(buffer)
 
     @abc.abstractmethod
     def unparse_magic(self) -> None:
@@ -90,6 +130,7 @@ class Unparser(abc.ABC):
         self.unparse_magic()
         self.unparse_header(r_data.versions, r_data.extra)
         self.unparse_r_object(r_data.object)
+        self.flush()
 
     def unparse_r_object(self, obj: RObject) -> None:  # noqa: C901, PLR0912
         """Unparse an RObject object."""
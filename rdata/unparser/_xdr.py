@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import struct
 from typing import TYPE_CHECKING, Any
 
 import numpy as np
@@ -11,24 +12,29 @@ from rdata.parser import R_INT_NA
 from ._unparser import Unparser
 
 if TYPE_CHECKING:
-    import io
+    from typing import Final
 
     import numpy.typing as npt
 
 
+_pack_int: Final = struct.Struct(">i").pack
+
+
 class UnparserXDR(Unparser):
     """Unparser for files in XDR format."""
 
-    def __init__(
-        self,
-        file: io.BytesIO,
-    ) -> None:
-        """Unparser for files in XDR format."""
-        self.file = file
-
     def unparse_magic(self) -> None:
         """Unparse magic bits."""
-        self.file.write(b"X\n")
+        self._write(b"X\n")
+
+    def unparse_int(self, value: int | np.int32) -> None:
+        """Unparse an integer value."""
+        try:
+            data = _pack_int(value)
+        except struct.error as e:
+            msg = "Integer not castable to int32"
+            raise ValueError(msg) from e
+        self._write(data)
 
     def _unparse_array_values(self, array: npt.NDArray[Any]) -> None:
         # Convert boolean to int
@@ -41,20 +47,19 @@ class UnparserXDR(Unparser):
                 mask = np.ma.getmask(array)  # type: ignore [no-untyped-call]
                 array = np.ma.getdata(array).copy()  # type: ignore [no-untyped-call]
                 array[mask] = R_INT_NA
-            info = np.iinfo(np.int32)
-            if not all(info.min <= val <= info.max for val in array):
-                msg = "Integer array not castable to int32"
-                raise ValueError(msg)
-            array = array.astype(np.int32)
-
-        # Convert to big endian if needed
-        array = array.astype(array.dtype.newbyteorder(">"))
-
-        # Create a contiguous data buffer if not already
-        # 1D array should be both C and F contiguous
-        assert array.flags["C_CONTIGUOUS"] == array.flags["F_CONTIGUOUS"]
-        data = array.data if array.flags["C_CONTIGUOUS"] else array.tobytes()
-        self.file.write(data)
+            if array.dtype != np.int32:
+                info = np.iinfo(np.int32)
+                if array.size > 0 and (
+                    array.min() < info.min or array.max() > info.max
+                ):
+                    msg = "Integer array not castable to int32"
+                    raise ValueError(msg)
+                array = array.astype(np.int32)
+
+        # Convert to a contiguous big-endian array,
+        # copying only if the data is not already such
+        array = np.ascontiguousarray(array, dtype=array.dtype.newbyteorder(">"))
+        self._write(array.data.cast("B"))
 
     def _unparse_string_characters(self, value: bytes) -> None:
-        self.file.write(value)
+        self._write(value)